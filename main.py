@@ -1,5 +1,7 @@
 import tkinter as tk
 import time
+import sys
+import random
 from collections import deque
 import heapq
 
@@ -56,16 +58,58 @@ DIRECTIONS = [
 
 DIAG_PAIRS = {(1, 1), (-1, -1)}
 
+# Jump Point Search tables for the move set above.
+# Free-space optimal paths only combine two cyclically adjacent moves
+# (E/SE, SE/S, S/W, W/NW, NW/N, N/E); JPS keeps the ordering that takes
+# the diagonal first, and N/S before E/W, so a node entered moving in
+# direction d only needs these natural successors ...
+JPS_NATURAL = {
+    ( 0,  1): [( 0,  1)],                        # E
+    ( 0, -1): [( 0, -1)],                        # W
+    ( 1,  0): [( 1,  0), ( 0, -1)],              # S  -> S, W
+    (-1,  0): [(-1,  0), ( 0,  1)],              # N  -> N, E
+    ( 1,  1): [( 1,  1), ( 0,  1), ( 1,  0)],    # SE -> SE, E, S
+    (-1, -1): [(-1, -1), ( 0, -1), (-1,  0)],    # NW -> NW, W, N
+}
+
+# ... plus a forced successor whenever the cell that the preferred
+# ordering would have gone through is blocked: (blocked offset, forced move).
+JPS_FORCED = {
+    ( 0,  1): [(( 1,  0), ( 1,  1)), ((-1, -1), (-1,  0))],   # E
+    ( 0, -1): [((-1,  0), (-1, -1)), (( 1,  1), ( 1,  0))],   # W
+    ( 1,  0): [(( 0,  1), ( 1,  1))],                         # S
+    (-1,  0): [(( 0, -1), (-1, -1))],                         # N
+    ( 1,  1): [],                                             # SE
+    (-1, -1): [],                                             # NW
+}
+
 #  HELPERS
 
-def get_neighbors(row, col):
+def passable(cells, row, col):
+    return 0 <= row < len(cells) and 0 <= col < len(cells[0]) and cells[row][col] == 0
+
+def get_neighbors(row, col, cells=None):
     """Yield valid (r, c, cost) neighbours in the required direction order."""
+    cells = grid if cells is None else cells
     for dr, dc in DIRECTIONS:
         r, c = row + dr, col + dc
-        if 0 <= r < ROWS and 0 <= c < COLS and grid[r][c] == 0:
+        if passable(cells, r, c):
             cost = DIAG_COST if (dr, dc) in DIAG_PAIRS else 1.0
             yield r, c, cost
 
+def path_cost(path):
+    """Total move cost of walking `path` one cell at a time."""
+    return sum(DIAG_COST if (r1 - r0, c1 - c0) in DIAG_PAIRS else 1.0
+               for (r0, c0), (r1, c1) in zip(path, path[1:]))
+
+def heuristic(a, b):
+    """Exact obstacle-free cost from a to b with DIRECTIONS (consistent)."""
+    dr, dc = b[0] - a[0], b[1] - a[1]
+    if dr * dc > 0:   # same sign – (1,1)/(-1,-1) diagonals are usable
+        diag = min(abs(dr), abs(dc))
+        return diag * DIAG_COST + (max(abs(dr), abs(dc)) - diag)
+    return float(abs(dr) + abs(dc))
+
 #  DRAWING
 
 def draw_grid(canvas, frontier=frozenset(), explored=frozenset(),
@@ -473,47 +517,423 @@ def bidirectional(canvas):
 # ──────────────────────────────────────────
 #  UCS
 # ──────────────────────────────────────────
-def ucs(canvas):
+def ucs_search(cells, start, target, on_expand=None):
+    """UCS over `cells`. Returns (path, cost, heap_ops); path is None if unreachable.
+
+    on_expand(current, frontier, explored, cost) is called for every expanded node.
+    """
     counter   = 0                          # tie-breaker to avoid comparing lists
-    pq        = [(0.0, counter, [START])]
+    pq        = [(0.0, counter, [start])]
+    heap_ops  = 1
     explored  = set()
-    best_cost = {START: 0.0}
+    best_cost = {start: 0.0}
 
     while pq:
         cost, _, path = heapq.heappop(pq)
+        heap_ops     += 1
         current       = path[-1]
 
         if current in explored:
             continue
         explored.add(current)
 
-        frontier = {entry[2][-1] for entry in pq}
-        draw_grid(canvas,
-                  frontier=frontier,
-                  explored=explored,
-                  status=f"UCS – exploring {current}  cost={cost:.2f}")
-        canvas.update()
-        time.sleep(STEP_DELAY)
+        if on_expand is not None:
+            on_expand(current, {entry[2][-1] for entry in pq}, explored, cost)
 
-        if current == TARGET:
-            draw_grid(canvas, path=set(path),
-                      status=f"UCS – Path Found! ✓  Total cost = {cost:.2f}")
-            canvas.update()
-            return path
+        if current == target:
+            return path, cost, heap_ops
 
         row, col = current
-        for r, c, move_cost in get_neighbors(row, col):
+        for r, c, move_cost in get_neighbors(row, col, cells):
             if (r, c) not in explored:
                 new_cost = cost + move_cost
                 if new_cost < best_cost.get((r, c), float('inf')):
                     best_cost[(r, c)] = new_cost
-                    counter += 1
+                    counter  += 1
+                    heap_ops += 1
                     heapq.heappush(pq, (new_cost, counter, path + [(r, c)]))
 
+    return None, None, heap_ops
+
+def ucs(canvas):
+    def show(current, frontier, explored, cost):
+        draw_grid(canvas,
+                  frontier=frontier,
+                  explored=explored,
+                  status=f"UCS – exploring {current}  cost={cost:.2f}")
+        canvas.update()
+        time.sleep(STEP_DELAY)
+
+    path, cost, _ = ucs_search(grid, START, TARGET, on_expand=show)
+
+    if path is not None:
+        draw_grid(canvas, path=set(path),
+                  status=f"UCS – Path Found! ✓  Total cost = {cost:.2f}")
+        canvas.update()
+        return path
+
     draw_grid(canvas, status="UCS – No path found ✗")
     canvas.update()
     return None
 
+# ──────────────────────────────────────────
+#  JPS  (Jump Point Search)
+# ──────────────────────────────────────────
+def jps_successors(cells, row, col, direction):
+    """Natural + forced moves for a node entered moving in `direction`."""
+    if direction is None:
+        return DIRECTIONS
+    moves = list(JPS_NATURAL[direction])
+    for (br, bc), move in JPS_FORCED[direction]:
+        if not passable(cells, row + br, col + bc):
+            moves.append(move)
+    return moves
+
+def jump(cells, row, col, dr, dc, target, memo):
+    """Walk from (row, col) in direction (dr, dc); return the next jump point or None.
+
+    `memo` caches results per (cell, direction) for one search, so the nested
+    turn scans visit every cell at most once per direction.
+    """
+    walked = []
+    while (row, col, dr, dc) not in memo:
+        walked.append((row, col, dr, dc))
+        row, col = row + dr, col + dc
+        if not passable(cells, row, col):
+            point = None
+            break
+        if (row, col) == target:
+            point = (row, col)
+            break
+
+        if any(not passable(cells, row + br, col + bc)
+               and passable(cells, row + fr, col + fc)
+               for (br, bc), (fr, fc) in JPS_FORCED[(dr, dc)]):
+            point = (row, col)
+            break
+
+        # A natural turn that leads somewhere makes this cell a jump point
+        if any(jump(cells, row, col, tr, tc, target, memo) is not None
+               for tr, tc in JPS_NATURAL[(dr, dc)][1:]):
+            point = (row, col)
+            break
+    else:
+        point = memo[(row, col, dr, dc)]
+
+    # Every cell walked over jumps to the same point in this direction
+    for key in walked:
+        memo[key] = point
+    return point
+
+def jps_search(cells, start, target, on_expand=None):
+    """A* over jump points. Returns (path, cost, heap_ops); path is None if unreachable.
+
+    on_expand(current, frontier, explored, cost) is called for every expanded jump point.
+    """
+    counter   = 0
+    pq        = [(heuristic(start, target), counter, 0.0, start, None)]
+    heap_ops  = 1
+    explored  = set()
+    best_cost = {start: 0.0}
+    parent    = {start: None}
+    memo      = {}
+
+    while pq:
+        _, _, cost, current, direction = heapq.heappop(pq)
+        heap_ops += 1
+
+        if current in explored:
+            continue
+        explored.add(current)
+
+        if on_expand is not None:
+            on_expand(current, {entry[3] for entry in pq}, explored, cost)
+
+        if current == target:
+            # Rebuild the jump-point chain, then fill in the straight segments
+            points = []
+            node   = current
+            while node is not None:
+                points.append(node)
+                node = parent[node]
+            points.reverse()
+
+            path = [points[0]]
+            for r1, c1 in points[1:]:
+                r0, c0 = path[-1]
+                dr, dc = (r1 > r0) - (r1 < r0), (c1 > c0) - (c1 < c0)
+                while path[-1] != (r1, c1):
+                    r0, c0 = r0 + dr, c0 + dc
+                    path.append((r0, c0))
+            return path, cost, heap_ops
+
+        row, col = current
+        for dr, dc in jps_successors(cells, row, col, direction):
+            point = jump(cells, row, col, dr, dc, target, memo)
+            if point is None or point in explored:
+                continue
+            steps    = max(abs(point[0] - row), abs(point[1] - col))
+            new_cost = cost + steps * (DIAG_COST if (dr, dc) in DIAG_PAIRS else 1.0)
+            if new_cost < best_cost.get(point, float('inf')):
+                best_cost[point] = new_cost
+                parent[point]    = current
+                counter  += 1
+                heap_ops += 1
+                heapq.heappush(pq, (new_cost + heuristic(point, target),
+                                    counter, new_cost, point, (dr, dc)))
+
+    return None, None, heap_ops
+
+def jps(canvas):
+    def show(current, frontier, explored, cost):
+        draw_grid(canvas,
+                  frontier=frontier,
+                  explored=explored,
+                  status=f"JPS – jump point {current}  cost={cost:.2f}")
+        canvas.update()
+        time.sleep(STEP_DELAY)
+
+    path, cost, heap_ops = jps_search(grid, START, TARGET, on_expand=show)
+
+    if path is not None:
+        draw_grid(canvas, path=set(path),
+                  status=f"JPS – Path Found! ✓  Total cost = {cost:.2f}  heap ops = {heap_ops}")
+        canvas.update()
+        return path
+
+    draw_grid(canvas, status="JPS – No path found ✗")
+    canvas.update()
+    return None
+
+def validate_jps(trials=500, rows=24, cols=24, seed=0, open_size=128):
+    """Cross-check jps_search against ucs_search on random maps; True if all costs match.
+
+    Also times both searches corner to corner on an open open_size × open_size map.
+    """
+    rng        = random.Random(seed)
+    mismatches = 0
+    ucs_ops    = jps_ops  = 0
+    ucs_time   = jps_time = 0.0
+
+    for trial in range(trials):
+        density = rng.choice((0.0, 0.1, 0.2, 0.3, 0.4))
+        cells   = [[1 if rng.random() < density else 0 for _ in range(cols)]
+                   for _ in range(rows)]
+        free    = [(r, c) for r in range(rows) for c in range(cols) if cells[r][c] == 0]
+        if len(free) < 2:
+            continue
+        start, target = rng.sample(free, 2)
+
+        t0 = time.perf_counter()
+        ucs_path, ucs_cost, u_ops = ucs_search(cells, start, target)
+        t1 = time.perf_counter()
+        jps_path, jps_cost, j_ops = jps_search(cells, start, target)
+        t2 = time.perf_counter()
+        ucs_ops  += u_ops
+        jps_ops  += j_ops
+        ucs_time += t1 - t0
+        jps_time += t2 - t1
+
+        if ucs_path is None or jps_path is None:
+            ok = ucs_path is None and jps_path is None
+        else:
+            # The JPS path must be a real walk through `cells` with the same cost
+            walk = sum(DIAG_COST if (r1 - r0, c1 - c0) in DIAG_PAIRS else 1.0
+                       for (r0, c0), (r1, c1) in zip(jps_path, jps_path[1:])
+                       if (r1 - r0, c1 - c0) in DIRECTIONS and cells[r1][c1] == 0)
+            ok = (abs(ucs_cost - jps_cost) < 1e-6 and abs(walk - jps_cost) < 1e-6
+                  and jps_path[0] == start and jps_path[-1] == target)
+        if not ok:
+            mismatches += 1
+            print(f"Mismatch on trial {trial}: density={density} start={start} "
+                  f"target={target} ucs={ucs_cost} jps={jps_cost}")
+
+    print(f"JPS validation: {trials - mismatches}/{trials} maps match UCS  "
+          f"heap ops UCS={ucs_ops} JPS={jps_ops}  "
+          f"time UCS={ucs_time:.3f}s JPS={jps_time:.3f}s")
+
+    cells  = [[0] * open_size for _ in range(open_size)]
+    corner = (open_size - 1, open_size - 1)
+    for name, search in (("UCS", ucs_search), ("JPS", jps_search)):
+        t0 = time.perf_counter()
+        _, cost, ops = search(cells, (0, 0), corner)
+        print(f"Open {open_size}x{open_size} map, {name}: cost={cost:.2f}  "
+              f"heap ops={ops}  time={time.perf_counter() - t0:.3f}s")
+    return mismatches == 0
+
+# ──────────────────────────────────────────
+#  ARA*  (Anytime Repairing A*)
+# ──────────────────────────────────────────
+def ara_star_search(cells, start, target, epsilon=3.0, step=0.5,
+                    time_budget=None, max_expansions=None):
+    """Yield (path, cost, bound) each time ARA* publishes a better solution.
+
+    The first path uses the heuristic inflated by `epsilon`; every later
+    iteration lowers it by `step` and repairs the previous search instead of
+    starting over. `bound` is the proven suboptimality factor (1.0 = optimal).
+    Stops at the optimum or once `time_budget` seconds of search time (time the
+    caller spends between results is not counted) or `max_expansions` run out.
+    Raises ValueError if `step` is not positive, since epsilon would never fall.
+    """
+    if step <= 0:
+        raise ValueError(f"step must be > 0, got {step}")
+
+    g          = {start: 0.0}
+    parent     = {start: None}
+    open_set   = {start}
+    closed     = set()
+    incons     = set()              # improved after being closed this iteration
+    eps        = max(1.0, epsilon)
+    counter    = 0
+    expansions = 0
+    spent      = 0.0
+    clock      = time.perf_counter()
+    best       = (float('inf'), float('inf'))   # (cost, bound) last published
+
+    while True:
+        # Re-key OPEN for the current epsilon (entries carry g to spot stale ones)
+        pq = []
+        for node in open_set:
+            counter += 1
+            pq.append((g[node] + eps * heuristic(node, target), counter, node, g[node]))
+        heapq.heapify(pq)
+
+        # ── ImprovePath ──
+        while True:
+            while pq and (pq[0][2] not in open_set or pq[0][3] != g[pq[0][2]]):
+                heapq.heappop(pq)
+            if not pq or g.get(target, float('inf')) <= pq[0][0]:
+                break
+
+            if max_expansions is not None and expansions >= max_expansions:
+                return
+            if time_budget is not None and spent + time.perf_counter() - clock > time_budget:
+                return
+
+            _, _, current, cost = heapq.heappop(pq)
+            open_set.discard(current)
+            closed.add(current)
+            expansions += 1
+
+            row, col = current
+            for r, c, move_cost in get_neighbors(row, col, cells):
+                new_cost = cost + move_cost
+                if new_cost < g.get((r, c), float('inf')):
+                    g[(r, c)]      = new_cost
+                    parent[(r, c)] = current
+                    if (r, c) in closed:
+                        incons.add((r, c))
+                    else:
+                        open_set.add((r, c))
+                        counter += 1
+                        heapq.heappush(pq, (new_cost + eps * heuristic((r, c), target),
+                                            counter, (r, c), new_cost))
+
+        if target not in g:
+            return                  # OPEN exhausted – no path exists
+
+        # ── Publish the current solution with its suboptimality bound ──
+        # Nodes in INCONS got a cheaper parent without updating their
+        # descendants, so g[target] can overstate the parent chain's cost;
+        # report what the extracted path actually costs.
+        path = []
+        node = target
+        while node is not None:
+            path.append(node)
+            node = parent[node]
+        path.reverse()
+
+        cost    = path_cost(path)
+        pending = open_set | incons
+        lower   = min((g[n] + heuristic(n, target) for n in pending), default=cost)
+        bound   = 1.0 if lower <= 0 else max(1.0, min(eps, cost / lower))
+
+        if (cost, bound) < best:
+            best  = (cost, bound)
+            spent += time.perf_counter() - clock
+            yield path, cost, bound
+            clock = time.perf_counter()
+
+        if bound <= 1.0:
+            return
+
+        eps       = max(1.0, eps - step)
+        open_set |= incons
+        incons    = set()
+        closed    = set()
+
+def validate_ara_star(trials=400, seed=0):
+    """Cross-check ara_star_search against ucs_search on random maps; True if all agree.
+
+    Every yield must walk through free cells at its reported cost and respect
+    cost <= bound * optimal; the last yield must match the UCS cost.
+    """
+    rng        = random.Random(seed)
+    mismatches = 0
+    yields     = 0
+    ucs_time   = ara_time = 0.0
+
+    for trial in range(trials):
+        size    = rng.choice((10, 24, 40))
+        density = rng.choice((0.0, 0.1, 0.2, 0.3, 0.4))
+        cells   = [[1 if rng.random() < density else 0 for _ in range(size)]
+                   for _ in range(size)]
+        free    = [(r, c) for r in range(size) for c in range(size) if cells[r][c] == 0]
+        if len(free) < 2:
+            continue
+        start, target = rng.sample(free, 2)
+
+        t0 = time.perf_counter()
+        _, best, _ = ucs_search(cells, start, target)
+        t1 = time.perf_counter()
+        results = list(ara_star_search(cells, start, target))
+        t2 = time.perf_counter()
+        ucs_time += t1 - t0
+        ara_time += t2 - t1
+        yields   += len(results)
+
+        if best is None:
+            ok = not results
+        else:
+            ok = bool(results) and abs(results[-1][1] - best) < 1e-6
+            for path, cost, bound in results:
+                ok = ok and (path[0] == start and path[-1] == target
+                             and all((r1 - r0, c1 - c0) in DIRECTIONS and cells[r1][c1] == 0
+                                     for (r0, c0), (r1, c1) in zip(path, path[1:]))
+                             and abs(path_cost(path) - cost) < 1e-6
+                             and cost <= bound * best + 1e-6)
+        if not ok:
+            mismatches += 1
+            print(f"Mismatch on trial {trial}: size={size} density={density} "
+                  f"start={start} target={target} ucs={best} "
+                  f"ara={[(cost, bound) for _, cost, bound in results]}")
+
+    print(f"ARA* validation: {trials - mismatches}/{trials} maps agree with UCS  "
+          f"yields={yields}  time UCS={ucs_time:.3f}s ARA*={ara_time:.3f}s")
+    return mismatches == 0
+
+def ara_star(canvas, time_budget):
+    result = None
+    for path, cost, bound in ara_star_search(grid, START, TARGET,
+                                             time_budget=time_budget):
+        result = path
+        draw_grid(canvas, path=set(path),
+                  status=f"ARA* – cost = {cost:.2f}  bound ≤ {bound:.2f}× optimal")
+        canvas.update()
+        time.sleep(STEP_DELAY * 5)
+
+    if result is None:
+        draw_grid(canvas, status="ARA* – No path found within budget ✗")
+        canvas.update()
+        return None
+
+    if bound <= 1.0:
+        status = f"ARA* – Optimal Path Found! ✓  Total cost = {cost:.2f}"
+    else:
+        status = f"ARA* – Budget used up ✓  cost = {cost:.2f}  bound ≤ {bound:.2f}×"
+    draw_grid(canvas, path=set(result), status=status)
+    canvas.update()
+    return result
 
 # ──────────────────────────────────────────
 #  RUN BUTTON CALLBACK
@@ -559,6 +979,17 @@ def run_algorithm():
         elif algo == "Bidir": bidirectional(canvas)
         elif algo == "DFS": dfs(canvas)
         elif algo == "UCS": ucs(canvas)
+        elif algo == "JPS": jps(canvas)
+        elif algo == "ARA*":
+            try:
+                budget_ms = float(budget_var.get())
+                if budget_ms <= 0:
+                    raise ValueError
+            except ValueError:
+                draw_grid(canvas, status="ARA* – Please enter a valid time budget (ms > 0)")
+                canvas.update()
+                return
+            ara_star(canvas, budget_ms / 1000.0)
         elif algo == "IDDFS": iddfs(canvas)
         elif algo == "DLS":
             try:
@@ -601,82 +1032,101 @@ def build_legend(parent):
 # ──────────────────────────────────────────
 #  MAIN WINDOW
 # ──────────────────────────────────────────
-root = tk.Tk()
-root.title("AI Pathfinder – BFS / DFS / UCS / DLS / IDDFS / Bidir")
-root.resizable(False, False)
-root.configure(bg="#FAFAFA")
-
-# Title
-tk.Label(root, text="AI Pathfinder",
-         font=("Arial", 16, "bold"), bg="#FAFAFA").pack(pady=(10, 4))
-
-# Canvas (extra 30 px for status bar)
-canvas = tk.Canvas(root,
-                   width=COLS * CELL_SIZE,
-                   height=ROWS * CELL_SIZE + 30,
-                   bg="#FAFAFA", bd=0, highlightthickness=0)
-canvas.pack(padx=10)
-
-# Controls row
-ctrl = tk.Frame(root, bg="#FAFAFA")
-ctrl.pack(pady=8)
-
-tk.Label(ctrl, text="Algorithm:", bg="#FAFAFA",
-         font=("Arial", 11)).grid(row=0, column=0, padx=6)
-
-algo_var = tk.StringVar(root)
-algo_var.set("BFS")
-tk.OptionMenu(ctrl, algo_var, "BFS", "DFS", "UCS", "DLS", "IDDFS", "Bidir").grid(row=0, column=1, padx=6)
-
-# Depth limit row (shown only for DLS)
-depth_frame = tk.Frame(root, bg="#FAFAFA")
-depth_frame.pack(pady=(0, 4))
-tk.Label(depth_frame, text="Depth Limit (DLS):", bg="#FAFAFA",
-         font=("Arial", 10)).grid(row=0, column=0, padx=6)
-depth_var = tk.StringVar(root)
-depth_var.set("15")
-depth_entry = tk.Entry(depth_frame, textvariable=depth_var, width=5,
-                       font=("Arial", 11), justify="center")
-depth_entry.grid(row=0, column=1, padx=4)
-tk.Label(depth_frame, text="(used by DLS only)", bg="#FAFAFA",
-         font=("Arial", 9), fg="#888888").grid(row=0, column=2, padx=6)
-
-# Start / Target input row
-st_frame = tk.Frame(root, bg="#FAFAFA")
-st_frame.pack(pady=(0, 4))
-
-tk.Label(st_frame, text="Start (row, col):", bg="#FAFAFA",
-         font=("Arial", 10)).grid(row=0, column=0, padx=(8,2))
-start_row_var = tk.StringVar(root); start_row_var.set("0")
-start_col_var = tk.StringVar(root); start_col_var.set("0")
-tk.Entry(st_frame, textvariable=start_row_var, width=3,
-         font=("Arial", 11), justify="center").grid(row=0, column=1, padx=2)
-tk.Label(st_frame, text=",", bg="#FAFAFA",
-         font=("Arial", 11)).grid(row=0, column=2)
-tk.Entry(st_frame, textvariable=start_col_var, width=3,
-         font=("Arial", 11), justify="center").grid(row=0, column=3, padx=2)
-
-tk.Label(st_frame, text="    Target (row, col):", bg="#FAFAFA",
-         font=("Arial", 10)).grid(row=0, column=4, padx=(16,2))
-target_row_var = tk.StringVar(root); target_row_var.set("9")
-target_col_var = tk.StringVar(root); target_col_var.set("9")
-tk.Entry(st_frame, textvariable=target_row_var, width=3,
-         font=("Arial", 11), justify="center").grid(row=0, column=5, padx=2)
-tk.Label(st_frame, text=",", bg="#FAFAFA",
-         font=("Arial", 11)).grid(row=0, column=6)
-tk.Entry(st_frame, textvariable=target_col_var, width=3,
-         font=("Arial", 11), justify="center").grid(row=0, column=7, padx=2)
-
-run_btn = tk.Button(ctrl, text="▶  Run Search",
-                    command=run_algorithm,
-                    bg="#2980B9", fg="white",
-                    font=("Arial", 11, "bold"),
-                    relief=tk.FLAT, padx=12, pady=4)
-run_btn.grid(row=0, column=2, padx=10)
-
-# Legend
-build_legend(root)
-# Initial draw
-draw_grid(canvas, status="Select an algorithm and press Run Search")
-
-root.mainloop()
\ No newline at end of file
+if __name__ == "__main__":
+    # Headless cross-checks:  python main.py --validate-jps / --validate-ara
+    if "--validate-jps" in sys.argv:
+        sys.exit(0 if validate_jps() else 1)
+    if "--validate-ara" in sys.argv:
+        sys.exit(0 if validate_ara_star() else 1)
+
+    root = tk.Tk()
+    root.title("AI Pathfinder – BFS / DFS / UCS / JPS / ARA* / DLS / IDDFS / Bidir")
+    root.resizable(False, False)
+    root.configure(bg="#FAFAFA")
+
+    # Title
+    tk.Label(root, text="AI Pathfinder",
+             font=("Arial", 16, "bold"), bg="#FAFAFA").pack(pady=(10, 4))
+
+    # Canvas (extra 30 px for status bar)
+    canvas = tk.Canvas(root,
+                       width=COLS * CELL_SIZE,
+                       height=ROWS * CELL_SIZE + 30,
+                       bg="#FAFAFA", bd=0, highlightthickness=0)
+    canvas.pack(padx=10)
+
+    # Controls row
+    ctrl = tk.Frame(root, bg="#FAFAFA")
+    ctrl.pack(pady=8)
+
+    tk.Label(ctrl, text="Algorithm:", bg="#FAFAFA",
+             font=("Arial", 11)).grid(row=0, column=0, padx=6)
+
+    algo_var = tk.StringVar(root)
+    algo_var.set("BFS")
+    tk.OptionMenu(ctrl, algo_var, "BFS", "DFS", "UCS", "JPS", "ARA*", "DLS", "IDDFS", "Bidir").grid(row=0, column=1, padx=6)
+
+    # Depth limit row (shown only for DLS)
+    depth_frame = tk.Frame(root, bg="#FAFAFA")
+    depth_frame.pack(pady=(0, 4))
+    tk.Label(depth_frame, text="Depth Limit (DLS):", bg="#FAFAFA",
+             font=("Arial", 10)).grid(row=0, column=0, padx=6)
+    depth_var = tk.StringVar(root)
+    depth_var.set("15")
+    depth_entry = tk.Entry(depth_frame, textvariable=depth_var, width=5,
+                           font=("Arial", 11), justify="center")
+    depth_entry.grid(row=0, column=1, padx=4)
+    tk.Label(depth_frame, text="(used by DLS only)", bg="#FAFAFA",
+             font=("Arial", 9), fg="#888888").grid(row=0, column=2, padx=6)
+
+    # Time budget row (used by ARA* only)
+    budget_frame = tk.Frame(root, bg="#FAFAFA")
+    budget_frame.pack(pady=(0, 4))
+    tk.Label(budget_frame, text="Time Budget ms (ARA*):", bg="#FAFAFA",
+             font=("Arial", 10)).grid(row=0, column=0, padx=6)
+    budget_var = tk.StringVar(root)
+    budget_var.set("5")
+    tk.Entry(budget_frame, textvariable=budget_var, width=5,
+             font=("Arial", 11), justify="center").grid(row=0, column=1, padx=4)
+    tk.Label(budget_frame, text="(used by ARA* only)", bg="#FAFAFA",
+             font=("Arial", 9), fg="#888888").grid(row=0, column=2, padx=6)
+
+    # Start / Target input row
+    st_frame = tk.Frame(root, bg="#FAFAFA")
+    st_frame.pack(pady=(0, 4))
+
+    tk.Label(st_frame, text="Start (row, col):", bg="#FAFAFA",
+             font=("Arial", 10)).grid(row=0, column=0, padx=(8,2))
+    start_row_var = tk.StringVar(root); start_row_var.set("0")
+    start_col_var = tk.StringVar(root); start_col_var.set("0")
+    tk.Entry(st_frame, textvariable=start_row_var, width=3,
+             font=("Arial", 11), justify="center").grid(row=0, column=1, padx=2)
+    tk.Label(st_frame, text=",", bg="#FAFAFA",
+             font=("Arial", 11)).grid(row=0, column=2)
+    tk.Entry(st_frame, textvariable=start_col_var, width=3,
+             font=("Arial", 11), justify="center").grid(row=0, column=3, padx=2)
+
+    tk.Label(st_frame, text="    Target (row, col):", bg="#FAFAFA",
+             font=("Arial", 10)).grid(row=0, column=4, padx=(16,2))
+    target_row_var = tk.StringVar(root); target_row_var.set("9")
+    target_col_var = tk.StringVar(root); target_col_var.set("9")
+    tk.Entry(st_frame, textvariable=target_row_var, width=3,
+             font=("Arial", 11), justify="center").grid(row=0, column=5, padx=2)
+    tk.Label(st_frame, text=",", bg="#FAFAFA",
+             font=("Arial", 11)).grid(row=0, column=6)
+    tk.Entry(st_frame, textvariable=target_col_var, width=3,
+             font=("Arial", 11), justify="center").grid(row=0, column=7, padx=2)
+
+    run_btn = tk.Button(ctrl, text="▶  Run Search",
+                        command=run_algorithm,
+                        bg="#2980B9", fg="white",
+                        font=("Arial", 11, "bold"),
+                        relief=tk.FLAT, padx=12, pady=4)
+    run_btn.grid(row=0, column=2, padx=10)
+
+    # Legend
+    build_legend(root)
+    # Initial draw
+    draw_grid(canvas, status="Select an algorithm and press Run Search")
+
+    root.mainloop()
\ No newline at end of file